@@ -6,6 +6,7 @@ Shows how to use FAF SDK for native AI context integration.
 This is what xAI engineers would use for bi-sync embedding.
 """
 
+import io
 import json
 from typing import Any, Dict, Optional
 from faf_sdk import (
@@ -18,8 +19,23 @@ from faf_sdk import (
     list_project_files
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def load_project_context(project_path: Optional[str] = None) -> Dict[str, Any]:
+
+def _dumps(obj: Any) -> str:
+    """Pretty-print JSON, using orjson's C encoder when it is installed"""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS: YAML allows int/bool keys, which json.dumps coerces
+        options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(obj, option=options, default=str).decode()
+    return json.dumps(obj, indent=2, default=str)
+
+
+def load_project_context(project_path: Optional[str] = None,
+                         deep: bool = False) -> Dict[str, Any]:
     """
     Load complete project context for AI processing
 
@@ -31,6 +47,8 @@ def load_project_context(project_path: Optional[str] = None) -> Dict[str, Any]:
 
     Args:
         project_path: Optional starting directory
+        deep: Run full validation (warnings + score) instead of the
+            quick validity check
 
     Returns:
         Structured context dict for AI
@@ -46,8 +64,8 @@ def load_project_context(project_path: Optional[str] = None) -> Dict[str, Any]:
     # Parse
     faf = parse_file(faf_path)
 
-    # Validate
-    result = validate(faf)
+    # Validate - only validity is used here, so skip warnings/score by default
+    result = validate(faf, mode="full" if deep else "quick")
     if not result.valid:
         return {
             "error": "Invalid FAF file",
@@ -158,52 +176,48 @@ def create_grok_context(project_path: Optional[str] = None) -> str:
     if "error" in context:
         return f"[FAF Error] {context['error']}"
 
-    # Build formatted string
-    lines = [
-        f"[FAF Context - {context['meta']['score']}% AI-ready]",
-        "",
-        f"Project: {context['project']['name']}",
-        f"Goal: {context['project']['goal']}",
-        ""
-    ]
-
-    if "instant" in context:
-        ic = context["instant"]
-        lines.extend([
-            f"Building: {ic['what']}",
-            f"Stack: {ic['stack']}",
-            ""
-        ])
-
-        if ic["key_files"]:
-            lines.append("Key files:")
-            for f in ic["key_files"]:
-                lines.append(f"  - {f}")
-            lines.append("")
-
-    if "stack" in context:
-        s = context["stack"]
-        stack_items = [f"{k}: {v}" for k, v in s.items() if v and v != "None"]
-        if stack_items:
-            lines.append("Stack details:")
-            for item in stack_items:
-                lines.append(f"  {item}")
-            lines.append("")
-
-    if "human" in context:
-        h = context["human"]
-        lines.extend([
-            "Context:",
-            f"  Who: {h['who']}",
-            f"  What: {h['what']}",
-            f"  Why: {h['why']}",
-            ""
-        ])
-
-    if context.get("tags"):
-        lines.append(f"Tags: {', '.join(context['tags'])}")
-
-    return "\n".join(lines)
+    # Build formatted string in one growing buffer
+    buf = io.StringIO()
+    w = buf.write
+
+    meta, project = context["meta"], context["project"]
+    w(f"[FAF Context - {meta['score']}% AI-ready]\n\n")
+    w(f"Project: {project['name']}\n")
+    w(f"Goal: {project['goal']}\n\n")
+
+    ic = context.get("instant")
+    if ic is not None:
+        w(f"Building: {ic['what']}\nStack: {ic['stack']}\n\n")
+
+        key_files = ic["key_files"]
+        if key_files:
+            w("Key files:\n")
+            for f in key_files:
+                w(f"  - {f}\n")
+            w("\n")
+
+    s = context.get("stack")
+    if s is not None:
+        header = False
+        for k, v in s.items():
+            if v and v != "None":
+                if not header:
+                    w("Stack details:\n")
+                    header = True
+                w(f"  {k}: {v}\n")
+        if header:
+            w("\n")
+
+    h = context.get("human")
+    if h is not None:
+        w(f"Context:\n  Who: {h['who']}\n  What: {h['what']}\n  Why: {h['why']}\n\n")
+
+    tags = context.get("tags")
+    if tags:
+        w(f"Tags: {', '.join(tags)}\n")
+
+    # Same shape as "\n".join(lines): no newline after the last line
+    return buf.getvalue()[:-1]
 
 
 # Example usage for xAI integration
@@ -221,7 +235,7 @@ if __name__ == "__main__":
         # Load structured context
         context = load_project_context()
         print("Structured context:")
-        print(json.dumps(context, indent=2, default=str))
+        print(_dumps(context))
 
         print("\n" + "=" * 50)
         print("\nFormatted for Grok:")
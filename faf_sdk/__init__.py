@@ -20,29 +20,85 @@ Usage:
 FAF defines. MD instructs. AI codes.
 """
 
-from .parser import parse, parse_file, stringify, FafFile
-from .validator import validate, ValidationResult
-from .mk4 import score_faf, Mk4Result, SlotState, LicenseTier
-from .discovery import find_faf_file, find_project_root, load_fafignore
-from .types import (
-    FafData,
-    ProjectInfo,
-    StackInfo,
-    InstantContext,
-    ContextQuality,
-    HumanContext,
-    AIScoring
-)
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .parser import parse, parse_bytes, parse_many, parse_file, stringify, FafFile
+    from .validator import validate, validate_many, ValidationResult
+    from .mk4 import score_faf, Mk4Result, SlotState, LicenseTier
+    from .discovery import find_faf_file, find_project_root, load_fafignore
+    from .types import (
+        FafData,
+        ProjectInfo,
+        StackInfo,
+        InstantContext,
+        ContextQuality,
+        HumanContext,
+        AIScoring
+    )
+
+# Public name -> submodule. Submodules (and PyYAML with them) load on first
+# attribute access (PEP 562), so importing faf_sdk for one function doesn't
+# pay for the rest.
+_LAZY = {
+    "parse": "parser",
+    "parse_bytes": "parser",
+    "parse_many": "parser",
+    "parse_file": "parser",
+    "stringify": "parser",
+    "FafFile": "parser",
+    "validate": "validator",
+    "validate_many": "validator",
+    "ValidationResult": "validator",
+    "score_faf": "mk4",
+    "Mk4Result": "mk4",
+    "SlotState": "mk4",
+    "LicenseTier": "mk4",
+    "find_faf_file": "discovery",
+    "find_project_root": "discovery",
+    "load_fafignore": "discovery",
+    "FafData": "types",
+    "ProjectInfo": "types",
+    "StackInfo": "types",
+    "InstantContext": "types",
+    "ContextQuality": "types",
+    "HumanContext": "types",
+    "AIScoring": "types",
+}
+
+
+_SUBMODULES = frozenset(["parser", "validator", "mk4", "discovery", "types"])
+
+
+def __getattr__(name: str) -> Any:
+    import importlib
+    if name in _SUBMODULES:
+        # Importing a submodule binds it on the package itself
+        return importlib.import_module(f".{name}", __name__)
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
+
 
 __version__ = "1.1.2"
 __all__ = [
     # Parser
     "parse",
+    "parse_bytes",
+    "parse_many",
     "parse_file",
     "stringify",
     "FafFile",
     # Validator
     "validate",
+    "validate_many",
     "ValidationResult",
     # Mk4 Scoring Engine
     "score_faf",
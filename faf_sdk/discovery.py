@@ -5,13 +5,21 @@ Mirrors claude-faf-mcp/src/faf-core/utils/file-utils.ts and fafignore-parser.ts
 """
 
 import os
+import re
 import fnmatch
+import functools
+import threading
+import time
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import (
+    Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Pattern, Sequence,
+    Tuple, TypeVar,
+)
 
 
-# Default ignore patterns (from TypeScript implementation)
-DEFAULT_IGNORE_PATTERNS = [
+# Default ignore patterns (from TypeScript implementation).
+# A tuple so it can be shared without defensive copies.
+DEFAULT_IGNORE_PATTERNS: Tuple[str, ...] = (
     # Dependencies
     "node_modules/",
     "vendor/",
@@ -98,7 +106,86 @@ DEFAULT_IGNORE_PATTERNS = [
     ".cache/",
     "tmp/",
     "temp/",
-]
+)
+
+# Files/directories whose presence marks a project root
+_PROJECT_MARKERS = frozenset([
+    "package.json",
+    "pyproject.toml",
+    "setup.py",
+    "requirements.txt",
+    "Cargo.toml",
+    "go.mod",
+    "pom.xml",
+    "build.gradle",
+    "Gemfile",
+    ".git",
+    "project.faf",
+    ".faf",
+])
+
+# Lower-cased marker -> marker, for shortlisting directory entries
+_MARKERS_BY_FOLDED = {marker.lower(): marker for marker in _PROJECT_MARKERS}
+
+# Discovery results are reused for this many seconds
+_CACHE_TTL = 5.0
+
+# (func_name, abspath, ...) -> (timestamp, result)
+_discovery_cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+
+# Keys being computed right now -> event set when the result is stored.
+# Concurrent callers asking for the same key wait for one walk.
+_inflight: Dict[Tuple[Any, ...], threading.Event] = {}
+_inflight_lock = threading.Lock()
+
+
+_T = TypeVar("_T")
+
+
+def _cached(key: Tuple[Any, ...], compute: Callable[[], _T]) -> _T:
+    """Return a fresh cached result for key, or compute and store it"""
+    now = time.monotonic()
+    hit = _discovery_cache.get(key)
+    if hit is not None and now - hit[0] < _CACHE_TTL:
+        return hit[1]  # type: ignore[no-any-return]
+
+    with _inflight_lock:
+        pending = _inflight.get(key)
+        if pending is None:
+            done = _inflight[key] = threading.Event()
+    if pending is not None:
+        pending.wait()
+        # If the other caller's walk raised, only an expired entry (or
+        # none) is left, so compute it here
+        hit = _discovery_cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < _CACHE_TTL:
+            return hit[1]  # type: ignore[no-any-return]
+        return compute()
+
+    try:
+        value = compute()
+        if len(_discovery_cache) >= 256:
+            # Drop expired entries so long-running processes don't grow forever
+            for stale in [k for k, (ts, _) in list(_discovery_cache.items())
+                          if now - ts >= _CACHE_TTL]:
+                _discovery_cache.pop(stale, None)
+        _discovery_cache[key] = (now, value)
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+        done.set()
+    return value
+
+
+def invalidate_cache() -> None:
+    """
+    Forget all memoized find_faf_file/find_project_root/load_fafignore results
+
+    Example:
+        >>> create_default_fafignore(root)
+        >>> invalidate_cache()
+    """
+    _discovery_cache.clear()
 
 
 def find_faf_file(start_dir: Optional[str] = None,
@@ -106,6 +193,9 @@ def find_faf_file(start_dir: Optional[str] = None,
     """
     Find project.faf or .faf file by walking up directory tree
 
+    Results are cached for a few seconds; call invalidate_cache() after
+    creating or removing .faf files if you need to see the change at once.
+
     Args:
         start_dir: Directory to start search (default: cwd)
         max_depth: Maximum parent directories to check
@@ -121,21 +211,29 @@ def find_faf_file(start_dir: Optional[str] = None,
     if start_dir is None:
         start_dir = os.getcwd()
 
-    current = Path(start_dir).resolve()
+    return _cached(
+        ("find_faf_file", os.path.abspath(start_dir), max_depth),
+        lambda: _find_faf_file(start_dir, max_depth),
+    )
+
+
+def _find_faf_file(start_dir: str, max_depth: int) -> Optional[str]:
+    """Uncached find_faf_file() walk"""
+    current = os.path.realpath(start_dir)
 
     for _ in range(max_depth):
         # Check for modern project.faf (preferred)
-        project_faf = current / "project.faf"
-        if project_faf.exists():
-            return str(project_faf)
+        project_faf = os.path.join(current, "project.faf")
+        if os.path.exists(project_faf):
+            return project_faf
 
         # Check for legacy .faf
-        legacy_faf = current / ".faf"
-        if legacy_faf.exists():
-            return str(legacy_faf)
+        legacy_faf = os.path.join(current, ".faf")
+        if os.path.exists(legacy_faf):
+            return legacy_faf
 
         # Move up to parent
-        parent = current.parent
+        parent = os.path.dirname(current)
         if parent == current:
             # Reached filesystem root
             break
@@ -150,6 +248,7 @@ def find_project_root(start_dir: Optional[str] = None,
     Find project root by looking for common project markers
 
     Looks for: package.json, pyproject.toml, Cargo.toml, go.mod, etc.
+    Results are cached for a few seconds (see invalidate_cache()).
 
     Args:
         start_dir: Directory to start search (default: cwd)
@@ -165,29 +264,36 @@ def find_project_root(start_dir: Optional[str] = None,
     if start_dir is None:
         start_dir = os.getcwd()
 
-    markers = [
-        "package.json",
-        "pyproject.toml",
-        "setup.py",
-        "requirements.txt",
-        "Cargo.toml",
-        "go.mod",
-        "pom.xml",
-        "build.gradle",
-        "Gemfile",
-        ".git",
-        "project.faf",
-        ".faf",
-    ]
+    return _cached(
+        ("find_project_root", os.path.abspath(start_dir), max_depth),
+        lambda: _find_project_root(start_dir, max_depth),
+    )
 
-    current = Path(start_dir).resolve()
 
-    for _ in range(max_depth):
-        for marker in markers:
-            if (current / marker).exists():
-                return str(current)
+def _find_project_root(start_dir: str, max_depth: int) -> Optional[str]:
+    """Uncached find_project_root() walk"""
+    current = os.path.realpath(start_dir)
 
-        parent = current.parent
+    for _ in range(max_depth):
+        # One directory read per level shortlists the markers to stat.
+        # Names are compared case-folded and confirmed with exists(), which
+        # matches case the way the filesystem does (insensitive on macOS and
+        # Windows) and skips dangling symlinks, as a per-marker probe would.
+        try:
+            with os.scandir(current) as it:
+                candidates = [_MARKERS_BY_FOLDED[name] for name in
+                              (entry.name.lower() for entry in it)
+                              if name in _MARKERS_BY_FOLDED]
+            if any(os.path.exists(os.path.join(current, marker))
+                   for marker in candidates):
+                return current
+        except OSError:
+            # Unlistable (e.g. execute-only) directory - probe markers directly
+            for marker in _PROJECT_MARKERS:
+                if os.path.exists(os.path.join(current, marker)):
+                    return current
+
+        parent = os.path.dirname(current)
         if parent == current:
             break
         current = parent
@@ -195,7 +301,7 @@ def find_project_root(start_dir: Optional[str] = None,
     return None
 
 
-def load_fafignore(project_root: str) -> List[str]:
+def load_fafignore(project_root: str) -> Sequence[str]:
     """
     Load .fafignore patterns from project root
 
@@ -205,7 +311,7 @@ def load_fafignore(project_root: str) -> List[str]:
         project_root: Path to project root directory
 
     Returns:
-        List of ignore patterns
+        List of ignore patterns, or the DEFAULT_IGNORE_PATTERNS tuple itself
 
     Example:
         >>> patterns = load_fafignore("/path/to/project")
@@ -214,24 +320,108 @@ def load_fafignore(project_root: str) -> List[str]:
     """
     fafignore_path = Path(project_root) / ".fafignore"
 
-    if not fafignore_path.exists():
-        return DEFAULT_IGNORE_PATTERNS.copy()
+    # Keyed on the file's mtime so edits to .fafignore take effect immediately
+    try:
+        mtime: Optional[float] = os.path.getmtime(fafignore_path)
+    except OSError:
+        mtime = None
+
+    patterns = _cached(
+        ("load_fafignore", os.path.abspath(project_root), mtime),
+        lambda: _load_fafignore(fafignore_path),
+    )
+    if patterns is DEFAULT_IGNORE_PATTERNS:
+        return patterns
+    return list(patterns)
+
 
-    patterns = []
+def _load_fafignore(fafignore_path: Path) -> Sequence[str]:
+    """Uncached load_fafignore() read"""
     try:
-        with open(fafignore_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                # Skip empty lines and comments
-                if line and not line.startswith('#'):
-                    patterns.append(line)
-    except IOError:
-        return DEFAULT_IGNORE_PATTERNS.copy()
+        text = fafignore_path.read_text(encoding='utf-8')
+    except OSError:
+        # Missing or unreadable .fafignore
+        return DEFAULT_IGNORE_PATTERNS
+
+    # Skip empty lines and comments
+    patterns = [
+        line for raw in text.splitlines()
+        if (line := raw.strip()) and not line.startswith('#')
+    ]
+
+    return patterns if patterns else DEFAULT_IGNORE_PATTERNS
+
+
+class _CompiledIgnore(NamedTuple):
+    """Ignore patterns compiled to one alternation regex per pattern kind"""
+    dirs: Optional[Pattern[str]]   # searched against the full path
+    files: Optional[Pattern[str]]  # matched against full path and basename
+
+
+# fnmatch normalizes case on Windows; mirror that in the compiled regexes
+_IGNORE_FLAGS = re.IGNORECASE if os.name == "nt" else 0
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_ignore(patterns: Tuple[str, ...]) -> _CompiledIgnore:
+    """
+    Compile ignore patterns once into alternation regexes
+
+    Directory patterns (ending with /) are literal: a single name matches
+    any path component, a nested one ("src/gen/") only a leading prefix.
+    File patterns use fnmatch semantics against the path or its basename.
+    """
+    dir_names = []
+    dir_prefixes = []
+    file_parts = []
+    for pattern in patterns:
+        if pattern.endswith('/'):
+            dir_pattern = pattern.rstrip('/')
+            if '/' in dir_pattern:
+                dir_prefixes.append(re.escape(dir_pattern))
+            else:
+                dir_names.append(re.escape(dir_pattern))
+        else:
+            file_parts.append(fnmatch.translate(pattern))
+
+    dir_alternatives = []
+    if dir_names:
+        dir_alternatives.append("(?:^|/)(?:" + "|".join(dir_names) + ")(?:/|$)")
+    if dir_prefixes:
+        dir_alternatives.append("^(?:" + "|".join(dir_prefixes) + ")(?:/|$)")
+
+    dirs = None
+    if dir_alternatives:
+        dirs = re.compile("|".join(dir_alternatives), _IGNORE_FLAGS)
+
+    files = None
+    if file_parts:
+        files = re.compile("|".join(file_parts), _IGNORE_FLAGS)
 
-    return patterns if patterns else DEFAULT_IGNORE_PATTERNS.copy()
+    return _CompiledIgnore(dirs, files)
 
 
-def should_ignore(file_path: str, patterns: List[str]) -> bool:
+# Compiled once at import for the common "no .fafignore" case
+_DEFAULT_COMPILED = _compile_ignore(DEFAULT_IGNORE_PATTERNS)
+
+
+def _should_ignore_compiled(file_path: str, compiled: _CompiledIgnore) -> bool:
+    """should_ignore() against patterns already run through _compile_ignore()"""
+    file_path = file_path.replace('\\', '/')
+
+    if compiled.dirs is not None and compiled.dirs.search(file_path):
+        return True
+
+    if compiled.files is not None:
+        if compiled.files.match(file_path):
+            return True
+        if compiled.files.match(file_path.rpartition('/')[2]):
+            return True
+
+    return False
+
+
+def should_ignore(file_path: str, patterns: Sequence[str]) -> bool:
     """
     Check if a file path should be ignored based on patterns
 
@@ -247,32 +437,11 @@ def should_ignore(file_path: str, patterns: List[str]) -> bool:
         >>> if not should_ignore("src/main.py", patterns):
         ...     process_file("src/main.py")
     """
-    # Normalize path separators
-    file_path = file_path.replace('\\', '/')
-
-    for pattern in patterns:
-        # Handle directory patterns (ending with /)
-        if pattern.endswith('/'):
-            dir_pattern = pattern.rstrip('/')
-            if file_path.startswith(dir_pattern + '/') or file_path == dir_pattern:
-                return True
-            # Check if any component matches
-            parts = file_path.split('/')
-            if dir_pattern in parts:
-                return True
-        else:
-            # File pattern
-            if fnmatch.fnmatch(file_path, pattern):
-                return True
-            # Also check basename
-            if fnmatch.fnmatch(os.path.basename(file_path), pattern):
-                return True
-
-    return False
+    return _should_ignore_compiled(file_path, _compile_ignore(tuple(patterns)))
 
 
 def list_project_files(project_root: str,
-                        ignore_patterns: Optional[List[str]] = None,
+                        ignore_patterns: Optional[Sequence[str]] = None,
                         extensions: Optional[List[str]] = None) -> List[str]:
     """
     List all project files, respecting .fafignore
@@ -292,27 +461,68 @@ def list_project_files(project_root: str,
     if ignore_patterns is None:
         ignore_patterns = load_fafignore(project_root)
 
-    root = Path(project_root)
-    files = []
+    if ignore_patterns is DEFAULT_IGNORE_PATTERNS:
+        compiled = _DEFAULT_COMPILED
+    else:
+        compiled = _compile_ignore(tuple(ignore_patterns))
 
-    for path in root.rglob("*"):
-        if not path.is_file():
-            continue
+    return sorted(_scan_tree(project_root, compiled, extensions))
 
-        relative = str(path.relative_to(root))
 
-        # Check ignore patterns
-        if should_ignore(relative, ignore_patterns):
+def _scan_tree(project_root: str,
+               compiled: _CompiledIgnore,
+               extensions: Optional[List[str]]) -> Iterator[str]:
+    """
+    Yield relative paths of non-ignored files under project_root
+
+    Walks with os.scandir and never descends into directories matched by a
+    directory ignore pattern (node_modules/, .git/, ...). Type checks use
+    the DirEntry's cached dirent data, so regular files cost no extra stat.
+    Unreadable directories are skipped.
+    """
+    root_len = len(os.path.join(project_root, ''))
+    wanted = frozenset(extensions) if extensions else None
+    dirs_search = compiled.dirs.search if compiled.dirs is not None else None
+    files_match = compiled.files.match if compiled.files is not None else None
+    posix = os.sep == '/'
+    stack = [project_root]
+
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
             continue
 
-        # Check extensions filter
-        if extensions:
-            if path.suffix.lower() not in extensions:
-                continue
+        with it:
+            for entry in it:
+                relative = entry.path[root_len:]
+                rel_posix = relative if posix else relative.replace('\\', '/')
+
+                # Directory patterns - prune matching directories before descending
+                if dirs_search is not None and dirs_search(rel_posix):
+                    continue
+
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+
+                if not entry.is_file():
+                    continue
+
+                # File patterns against the full path and the basename
+                if files_match is not None and (
+                        files_match(rel_posix) or files_match(entry.name)):
+                    continue
 
-        files.append(relative)
+                # Check extensions filter (PurePath.suffix rules, inlined)
+                if wanted is not None:
+                    name = entry.name
+                    i = name.rfind('.')
+                    ext = name[i:].lower() if 0 < i < len(name) - 1 else ''
+                    if ext not in wanted:
+                        continue
 
-    return sorted(files)
+                yield relative
 
 
 def create_default_fafignore(project_root: str) -> str:
@@ -4,11 +4,55 @@ Core FAF parser - YAML parsing with validation
 Mirrors the TypeScript fix-once/yaml.ts implementation for cross-language compatibility.
 """
 
+import codecs
+import copy
+import hashlib
+import logging
+import os
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
 import yaml
-from typing import Any, Dict, Optional, Union
-from dataclasses import dataclass
 
-from .types import FafData
+from .types import _SLOTS, FafData
+
+# Prefer the libyaml-backed C loader/dumper (shipped in the PyYAML wheels);
+# fall back to the pure-Python implementations when it isn't available.
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+    USING_LIBYAML = True
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper  # type: ignore[assignment]
+    USING_LIBYAML = False
+    logging.getLogger(__name__).warning(
+        "PyYAML was built without libyaml; faf_sdk is using the pure-Python "
+        "YAML loader, which is over 10x slower"
+    )
+
+# Schema keys shared by every .faf file. Interning them means every parsed
+# document reuses one string object per key and lookups with the literal
+# keys used throughout the SDK hit the identity fast path.
+_INTERN_KEYS = frozenset([
+    "faf_version", "ai_score", "project", "name", "goal", "main_language",
+    "instant_context", "stack", "human_context", "tags", "what_building",
+    "tech_stack", "deployment", "key_files", "commands", "context_quality",
+    "slots_filled", "confidence", "handoff_ready", "missing_context",
+    "frontend", "backend", "database", "infrastructure", "build_tool",
+    "testing", "cicd", "who", "what", "why", "how", "where", "when",
+])
+
+# Parse cache size, for each of the content and file caches
+_CACHE_SIZE = 128
+
+# Parsed results by content hash, and by (absolute path, mtime, size).
+# The cached FafFiles are never handed out: each call gets its own copy
+# of raw and a FafData built from it (see _fresh).
+_content_cache: "OrderedDict[bytes, FafFile]" = OrderedDict()
+_file_cache: "OrderedDict[Tuple[str, int, int], FafFile]" = OrderedDict()
+_cache_lock = threading.Lock()
 
 
 class FafParseError(Exception):
@@ -16,7 +60,7 @@ class FafParseError(Exception):
     pass
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class FafFile:
     """
     Parsed FAF file with both raw and typed access
@@ -30,6 +74,10 @@ class FafFile:
     raw: Dict[str, Any]
     path: Optional[str] = None
 
+    # Source line of each top-level key, for validation messages. Kept
+    # instead of the composed node tree, which is ~4x the size of raw.
+    _lines: Optional[Dict[str, int]] = field(default=None, repr=False, compare=False)
+
     @property
     def project_name(self) -> str:
         """Quick access to project name"""
@@ -60,6 +108,10 @@ def parse(content: Union[str, None], path: Optional[str] = None) -> FafFile:
     Raises:
         FafParseError: If content is invalid
 
+    Note:
+        Results are cached by content hash. Each call still returns its
+        own ``data`` and ``raw`` objects, so modifying one is safe.
+
     Example:
         >>> content = open("project.faf").read()
         >>> faf = parse(content)
@@ -77,9 +129,129 @@ def parse(content: Union[str, None], path: Optional[str] = None) -> FafFile:
     if not content:
         raise FafParseError("Content is empty")
 
-    # Parse YAML
+    return _fresh(_parse_cached(content.encode("utf-8", "surrogatepass"), content, path), path)
+
+
+def parse_bytes(buf: Union[bytes, bytearray, memoryview],
+                path: Optional[str] = None) -> FafFile:
+    """
+    Parse FAF content from raw bytes
+
+    Skips the str decode: the buffer goes straight to the YAML reader,
+    which detects UTF-8/UTF-16 itself. bytearray and memoryview are
+    copied to bytes first, as the C loader only reads bytes.
+
+    Args:
+        buf: Encoded content of a .faf file
+        path: Optional file path for error messages
+
+    Returns:
+        FafFile object with parsed data
+
+    Raises:
+        FafParseError: If content is invalid
+
+    Example:
+        >>> with open("project.faf", "rb") as f:
+        ...     faf = parse_bytes(f.read(), path="project.faf")
+    """
+    if not isinstance(buf, (bytes, bytearray, memoryview)):
+        raise FafParseError(f"Content must be bytes, got {type(buf).__name__}")
+
+    return _fresh(_parse_bytes_cached(bytes(buf), path), path)
+
+
+def parse_many(contents: Iterable[Union[str, bytes]]) -> List[FafFile]:
+    """
+    Parse a batch of FAF documents
+
+    Args:
+        contents: YAML strings (or encoded bytes) of .faf files
+
+    Returns:
+        List of FafFile objects, in input order
+
+    Raises:
+        FafParseError: On the first invalid document
+
+    Example:
+        >>> fafs = parse_many(p.read_bytes() for p in paths)
+    """
+    results: List[FafFile] = []
+    append = results.append
+    for content in contents:
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            append(parse_bytes(content))
+        else:
+            append(parse(content))
+    return results
+
+
+_UTF16_BOMS = (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+
+
+def _parse_bytes_cached(content: bytes, path: Optional[str]) -> FafFile:
+    """Strip and check encoded content, then parse it through the content cache"""
+    # Byte-level strip is only safe for ASCII-compatible encodings: it
+    # would cut the 0x00 half off a trailing UTF-16 newline
+    if not content.startswith(_UTF16_BOMS):
+        content = content.strip()
+    if not content:
+        raise FafParseError("Content is empty")
+
+    return _parse_cached(content, content, path)
+
+
+def _parse_cached(key_bytes: bytes, content: Union[str, bytes],
+                  path: Optional[str]) -> FafFile:
+    """Cached parse of content, parsing on a miss (pass the result to _fresh)"""
+    # Identical content parses to an identical FafFile
+    key = hashlib.blake2b(key_bytes, digest_size=16).digest()
+    cached = _cache_get(_content_cache, key)
+    if cached is None:
+        cached = _parse_content(content, path)
+        _cache_put(_content_cache, key, cached)
+    return cached
+
+
+def _cache_get(cache: "OrderedDict[Any, FafFile]", key: Any) -> Optional[FafFile]:
+    """LRU lookup in one of the parse caches"""
+    with _cache_lock:
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+    return cached
+
+
+def _cache_put(cache: "OrderedDict[Any, FafFile]", key: Any, faf: FafFile) -> None:
+    """Store a parse result, evicting the least recently used past _CACHE_SIZE"""
+    with _cache_lock:
+        cache[key] = faf
+        if len(cache) > _CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+def _fresh(cached: FafFile, path: Optional[str]) -> FafFile:
+    """
+    Copy a cached parse result for a caller
+
+    raw is deep-copied and FafData rebuilt from the copy, so callers can
+    modify what they get back without touching the cache or each other.
+    """
+    raw = copy.deepcopy(cached.raw)
+    return FafFile(
+        data=FafData.from_dict(raw),
+        raw=raw,
+        path=path,
+        _lines=cached._lines
+    )
+
+
+def _parse_content(content: Union[str, bytes], path: Optional[str]) -> FafFile:
+    """Parse stripped, non-empty YAML content into a FafFile (uncached)"""
+    # Parse YAML - compose once and keep key positions from the node tree
     try:
-        data = yaml.safe_load(content)
+        node, data = _compose_and_construct(content)
     except yaml.YAMLError as e:
         location = f" in {path}" if path else ""
         raise FafParseError(f"Invalid YAML syntax{location}: {e}")
@@ -103,10 +275,113 @@ def parse(content: Union[str, None], path: Optional[str] = None) -> FafFile:
     return FafFile(
         data=faf_data,
         raw=data,
-        path=path
+        path=None,
+        _lines=_key_lines(node)
     )
 
 
+def _intern_keys(data: Dict[Any, Any]) -> Dict[Any, Any]:
+    """Rebuild the top two dict levels with known schema keys interned"""
+    out = {}
+    for k, v in data.items():
+        if k in _INTERN_KEYS:
+            k = sys.intern(k)
+            if isinstance(v, dict):
+                v = {sys.intern(sk) if sk in _INTERN_KEYS else sk: sv
+                     for sk, sv in v.items()}
+        out[k] = v
+    return out
+
+
+def _key_lines(node: Optional[yaml.Node]) -> Optional[Dict[str, int]]:
+    """1-based source line of each top-level key of a composed mapping"""
+    if not isinstance(node, yaml.MappingNode):
+        return None
+    lines: Dict[str, int] = {}
+    for key_node, _ in node.value:
+        key = key_node.value
+        if isinstance(key, str) and key not in lines:
+            lines[sys.intern(key) if key in _INTERN_KEYS else key] = key_node.start_mark.line + 1
+    return lines
+
+
+def _compose_and_construct(content: Union[str, bytes]) -> Tuple[Optional[yaml.Node], Any]:
+    """yaml.load() split in two steps so the composed node tree is kept"""
+    loader = _SafeLoader(content)
+    try:
+        node = loader.get_single_node()
+        if node is None:
+            data = None
+        else:
+            try:
+                data = _construct_plain(loader, node, set())
+            except (_NotPlain, RecursionError):
+                data = loader.construct_document(node)
+                if isinstance(data, dict):
+                    data = _intern_keys(data)
+    finally:
+        loader.dispose()
+    return node, data
+
+
+_STR_TAG = "tag:yaml.org,2002:str"
+_NULL_TAG = "tag:yaml.org,2002:null"
+_BOOL_TAG = "tag:yaml.org,2002:bool"
+_INT_TAG = "tag:yaml.org,2002:int"
+_MAP_TAG = "tag:yaml.org,2002:map"
+_SEQ_TAG = "tag:yaml.org,2002:seq"
+_SPECIAL_KEY_TAGS = frozenset(["tag:yaml.org,2002:merge", "tag:yaml.org,2002:value"])
+_BOOL_VALUES = yaml.constructor.SafeConstructor.bool_values
+
+
+class _NotPlain(Exception):
+    """Node tree needs PyYAML's full constructor"""
+
+
+def _construct_plain(loader: Any, node: yaml.Node, seen: Set[yaml.Node]) -> Any:
+    """
+    Build Python objects from a composed node tree, without tag dispatch
+
+    Handles the shapes .faf files are made of - plain maps, sequences and
+    str/null/bool/decimal-int scalars - inline, and hands any other scalar
+    to the loader. Known schema keys are interned as they are built.
+    Raises _NotPlain for anything that needs the full constructor (merge
+    keys, aliased collections, non-scalar keys, other collection tags),
+    so the caller can start over with it.
+    """
+    if isinstance(node, yaml.ScalarNode):
+        tag = node.tag
+        if tag == _STR_TAG:
+            return node.value
+        if tag == _NULL_TAG:
+            return None
+        if tag == _BOOL_TAG:
+            return _BOOL_VALUES[node.value.lower()]
+        if tag == _INT_TAG:
+            value = node.value
+            if value.isdigit() and (value[0] != "0" or len(value) == 1):
+                return int(value)
+        return loader.construct_object(node)
+
+    if node in seen:
+        raise _NotPlain
+    seen.add(node)
+
+    if isinstance(node, yaml.MappingNode) and node.tag == _MAP_TAG:
+        out = {}
+        for key_node, value_node in node.value:
+            if not isinstance(key_node, yaml.ScalarNode) or key_node.tag in _SPECIAL_KEY_TAGS:
+                raise _NotPlain
+            key = _construct_plain(loader, key_node, seen)
+            if key in _INTERN_KEYS:
+                key = sys.intern(key)
+            out[key] = _construct_plain(loader, value_node, seen)
+        return out
+    if isinstance(node, yaml.SequenceNode) and node.tag == _SEQ_TAG:
+        return [_construct_plain(loader, item, seen) for item in node.value]
+    raise _NotPlain
+
+
 def parse_file(filepath: str) -> FafFile:
     """
     Parse FAF from file path
@@ -126,14 +401,41 @@ def parse_file(filepath: str) -> FafFile:
         >>> print(faf.data.instant_context.tech_stack)
     """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+        st = os.stat(filepath)
     except FileNotFoundError:
         raise FileNotFoundError(f"FAF file not found: {filepath}")
-    except IOError as e:
+    except OSError as e:
         raise FafParseError(f"Failed to read {filepath}: {e}")
 
-    return parse(content, path=filepath)
+    # Keyed on the absolute path (a relative one depends on the working
+    # directory) plus mtime and size, so edits to the file invalidate the entry
+    key = (os.path.abspath(filepath), st.st_mtime_ns, st.st_size)
+    cached = _cache_get(_file_cache, key)
+    if cached is None:
+        try:
+            with open(filepath, 'rb') as f:
+                content = f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"FAF file not found: {filepath}")
+        except IOError as e:
+            raise FafParseError(f"Failed to read {filepath}: {e}")
+
+        cached = _parse_bytes_cached(content, filepath)
+        _cache_put(_file_cache, key, cached)
+
+    return _fresh(cached, filepath)
+
+
+def clear_cache() -> None:
+    """
+    Drop all cached parse results
+
+    Example:
+        >>> clear_cache()  # force the next parse_file() to re-read from disk
+    """
+    with _cache_lock:
+        _content_cache.clear()
+        _file_cache.clear()
 
 
 def stringify(data: Union[Dict[str, Any], FafFile, FafData],
@@ -160,6 +462,7 @@ def stringify(data: Union[Dict[str, Any], FafFile, FafData],
 
     return yaml.dump(
         data,
+        Dumper=_SafeDumper,
         default_flow_style=default_flow_style,
         allow_unicode=True,
         sort_keys=False,
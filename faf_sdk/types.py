@@ -4,11 +4,20 @@ Type definitions for FAF (Foundational AI-context Format)
 These mirror the TypeScript definitions in faf-cli for cross-language compatibility.
 """
 
+import dataclasses
+import functools
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union,
+    get_args, get_origin, get_type_hints,
+)
 
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class ProjectInfo:
     """Core project metadata"""
     name: str
@@ -19,7 +28,7 @@ class ProjectInfo:
     license: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class StackInfo:
     """Technical stack breakdown"""
     frontend: Optional[str] = None
@@ -31,7 +40,7 @@ class StackInfo:
     cicd: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class InstantContext:
     """Quick context for AI understanding"""
     what_building: Optional[str] = None
@@ -41,7 +50,7 @@ class InstantContext:
     commands: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ContextQuality:
     """Quality metrics for the FAF file"""
     slots_filled: Optional[str] = None
@@ -50,7 +59,7 @@ class ContextQuality:
     missing_context: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class HumanContext:
     """The 6 W's - human-readable context"""
     who: Optional[str] = None  # Target users
@@ -61,7 +70,7 @@ class HumanContext:
     when: Optional[str] = None  # Timeline
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AIScoring:
     """AI-readiness scoring system"""
     score: Optional[int] = None  # 0-100
@@ -69,7 +78,7 @@ class AIScoring:
     version: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AIInstructions:
     """Instructions for AI assistants"""
     working_style: Optional[str] = None
@@ -78,7 +87,7 @@ class AIInstructions:
     focus_areas: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Preferences:
     """Development preferences"""
     quality_bar: Optional[str] = None
@@ -87,7 +96,7 @@ class Preferences:
     code_style: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class State:
     """Project state tracking"""
     phase: Optional[str] = None
@@ -96,7 +105,7 @@ class State:
     milestones: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FafData:
     """
     Complete FAF file structure
@@ -123,91 +132,118 @@ class FafData:
     # Raw data for unrecognized fields
     raw: Dict[str, Any] = field(default_factory=dict)
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "FafData":
-        """Create FafData from parsed YAML dictionary"""
-        project_data = data.get("project", {})
-        if isinstance(project_data, str):
-            project_data = {"name": project_data}
-        elif not isinstance(project_data, dict):
-            project_data = {}
-
-        project = ProjectInfo(
-            name=project_data.get("name", "unknown"),
-            goal=project_data.get("goal"),
-            main_language=project_data.get("main_language"),
-            approach=project_data.get("approach"),
-            version=project_data.get("version"),
-            license=project_data.get("license")
-        )
-
-        # Parse instant_context
-        instant_ctx = None
-        if "instant_context" in data:
-            ic = data["instant_context"]
-            instant_ctx = InstantContext(
-                what_building=ic.get("what_building"),
-                tech_stack=ic.get("tech_stack"),
-                deployment=ic.get("deployment"),
-                key_files=ic.get("key_files", []),
-                commands=ic.get("commands", {})
-            )
-
-        # Parse stack
-        stack = None
-        if "stack" in data:
-            s = data["stack"]
-            stack = StackInfo(
-                frontend=s.get("frontend"),
-                backend=s.get("backend"),
-                database=s.get("database"),
-                infrastructure=s.get("infrastructure"),
-                build_tool=s.get("build_tool"),
-                testing=s.get("testing"),
-                cicd=s.get("cicd")
-            )
-
-        # Parse context_quality
-        ctx_quality = None
-        if "context_quality" in data:
-            cq = data["context_quality"]
-            ctx_quality = ContextQuality(
-                slots_filled=cq.get("slots_filled"),
-                confidence=cq.get("confidence"),
-                handoff_ready=cq.get("handoff_ready", False),
-                missing_context=cq.get("missing_context", [])
-            )
-
-        # Parse human_context
-        human_ctx = None
-        if "human_context" in data:
-            hc = data["human_context"]
-            human_ctx = HumanContext(
-                who=hc.get("who"),
-                what=hc.get("what"),
-                why=hc.get("why"),
-                how=hc.get("how"),
-                where=hc.get("where"),
-                when=hc.get("when")
-            )
-
-        # Parse AI score
-        ai_score = data.get("ai_score")
-        if isinstance(ai_score, str) and ai_score.endswith("%"):
-            ai_score = int(ai_score.rstrip("%"))
-
-        return cls(
-            faf_version=data.get("faf_version", "2.5.0"),
-            project=project,
-            ai_score=ai_score,
-            ai_confidence=data.get("ai_confidence"),
-            ai_tldr=data.get("ai_tldr"),
-            instant_context=instant_ctx,
-            context_quality=ctx_quality,
-            stack=stack,
-            human_context=human_ctx,
-            preferences=None,  # Add parsing if needed
-            state=None,  # Add parsing if needed
-            tags=data.get("tags", []),
-            raw=data
-        )
+    if TYPE_CHECKING:
+        # Generated at import time by _build_from_dict() below
+        @classmethod
+        def from_dict(cls, data: Dict[str, Any]) -> "FafData":
+            """Create FafData from parsed YAML dictionary"""
+            ...
+
+
+# Optional sections from_dict leaves unparsed (always None for now)
+_UNPARSED_SECTIONS = frozenset(["ai_instructions", "preferences", "state"])
+
+# Fallbacks for fields the dataclasses declare without a default
+_FROM_DICT_DEFAULTS = {
+    (ProjectInfo, "name"): "unknown",
+    (FafData, "faf_version"): "2.5.0",
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_ai_score(value: str) -> int:
+    """Integer from a percentage string like '85%'; memoized per value"""
+    return int(value.rstrip("%"))
+
+
+def _section_type(tp: Any) -> Optional[type]:
+    """Dataclass X for an Optional[X] annotation, else None"""
+    args = [a for a in get_args(tp) if a is not type(None)]
+    if get_origin(tp) is Union and len(args) == 1:
+        arg = args[0]
+        if isinstance(arg, type) and dataclasses.is_dataclass(arg):
+            return arg
+    return None
+
+
+def _get_expr(cls: type, f: "dataclasses.Field[Any]", src: str, ns: Dict[str, Any]) -> str:
+    """Source for `src.get(name, <default>)` honouring the field's default"""
+    key = (cls, f.name)
+    if key in _FROM_DICT_DEFAULTS:
+        default: Any = _FROM_DICT_DEFAULTS[key]
+    elif f.default_factory is list:  # type: ignore[comparison-overlap]
+        # Only build the empty default when the key is absent
+        return f"({src}[{f.name!r}] if {f.name!r} in {src} else [])"
+    elif f.default_factory is dict:  # type: ignore[comparison-overlap]
+        return f"({src}[{f.name!r}] if {f.name!r} in {src} else {{}})"
+    else:
+        default = f.default
+
+    if default is None or default is dataclasses.MISSING:
+        return f"{src}.get({f.name!r})"
+    if isinstance(default, (bool, int, str)):
+        return f"{src}.get({f.name!r}, {default!r})"
+    ref = f"_default_{cls.__name__}_{f.name}"
+    ns[ref] = default
+    return f"{src}.get({f.name!r}, {ref})"
+
+
+def _ctor_expr(cls: type, src: str, ns: Dict[str, Any]) -> str:
+    """Source for a straight-line `Cls(field=src.get(...), ...)` call"""
+    ns[cls.__name__] = cls
+    args = ", ".join(
+        f"{f.name}={_get_expr(cls, f, src, ns)}" for f in dataclasses.fields(cls)
+    )
+    return f"{cls.__name__}({args})"
+
+
+def _build_from_dict() -> Callable[..., FafData]:
+    """
+    Generate FafData.from_dict as straight-line code
+
+    Each nested section becomes one constructor call with every field
+    spelled out, instead of a generic walk over the dict.
+    """
+    ns: Dict[str, Any] = {"_parse_ai_score": _parse_ai_score}
+    hints = get_type_hints(FafData)
+    lines = [
+        "def from_dict(cls, d):",
+        "    project_data = d.get('project', {})",
+        "    if isinstance(project_data, str):",
+        "        project_data = {'name': project_data}",
+        "    elif not isinstance(project_data, dict):",
+        "        project_data = {}",
+        f"    project = {_ctor_expr(ProjectInfo, 'project_data', ns)}",
+    ]
+
+    kwargs = ["project=project", "ai_score=ai_score", "raw=d"]
+    for f in dataclasses.fields(FafData):
+        if f.name in ("project", "ai_score", "raw") or f.name in _UNPARSED_SECTIONS:
+            continue
+        section = _section_type(hints[f.name])
+        if section is not None:
+            lines += [
+                f"    if {f.name!r} in d:",
+                f"        s = d[{f.name!r}]",
+                f"        {f.name} = {_ctor_expr(section, 's', ns)}",
+                "    else:",
+                f"        {f.name} = None",
+            ]
+            kwargs.append(f"{f.name}={f.name}")
+        else:
+            kwargs.append(f"{f.name}={_get_expr(FafData, f, 'd', ns)}")
+
+    lines += [
+        "    ai_score = d.get('ai_score')",
+        "    if isinstance(ai_score, str) and ai_score.endswith('%'):",
+        "        ai_score = _parse_ai_score(ai_score)",
+        f"    return cls({', '.join(kwargs)})",
+    ]
+
+    exec(compile("\n".join(lines) + "\n", "<faf_sdk.types.from_dict>", "exec"), ns)
+    from_dict = ns["from_dict"]
+    from_dict.__doc__ = "Create FafData from parsed YAML dictionary"
+    return from_dict  # type: ignore[no-any-return]
+
+
+FafData.from_dict = classmethod(_build_from_dict())  # type: ignore[assignment,method-assign]
@@ -4,41 +4,92 @@ FAF validation - check structure and completeness
 Mirrors claude-faf-mcp/src/faf-core/commands/validate.ts
 """
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Tuple, Union
-
-from .parser import FafFile, parse
-
-
-@dataclass
+import functools
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .types import _SLOTS
+
+# The parser (and PyYAML) is only needed for YAML string input, so it is
+# imported on first use rather than with this module
+if TYPE_CHECKING:
+    from .parser import FafFile
+    from .types import FafData
+
+
+# Completeness rules, in message order:
+# (section, points if present, severity if missing, message if missing,
+#  ((sub-key, points if truthy, message if missing or None), ...))
+# Missing "required" sections are errors, "recommended" ones warnings, and
+# "optional" ones only cost points. Sub-keys share the section's severity.
+#
+# Scoring breakdown:
+# - Required fields (30 points)
+# - Core sections (40 points)
+# - Extended sections (30 points)
+_RULES: Tuple[Tuple[str, int, str, str, Tuple[Tuple[str, int, Optional[str]], ...]], ...] = (
+    ("faf_version", 10, "required", "Missing required field: faf_version", ()),
+    ("project", 10, "required", "Missing required field: project", (
+        ("name", 5, "Missing required field: project.name"),
+        ("goal", 5, None),
+    )),
+    ("instant_context", 5, "recommended", "Missing recommended section: instant_context", (
+        ("what_building", 5, "Missing instant_context.what_building"),
+        ("tech_stack", 5, "Missing instant_context.tech_stack"),
+        ("key_files", 5, None),
+    )),
+    ("stack", 10, "recommended", "Missing recommended section: stack", ()),
+    ("context_quality", 5, "optional", "", ()),
+    ("human_context", 10, "recommended", "Missing section: human_context (the 6 W's)", ()),
+    ("ai_instructions", 5, "recommended", "Missing section: ai_instructions", ()),
+    ("preferences", 5, "optional", "", ()),
+    ("state", 5, "optional", "", ()),
+)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class ValidationResult:
     """
     Result of FAF validation
 
+    Immutable and hashable, so results can be cached and shared.
+
     Attributes:
         valid: True if no errors (warnings OK)
-        errors: List of critical errors
-        warnings: List of non-critical warnings
+        errors: Tuple of critical errors
+        warnings: Tuple of non-critical warnings
         score: Calculated completeness score (0-100)
     """
     valid: bool
-    errors: List[str] = field(default_factory=list)
-    warnings: List[str] = field(default_factory=list)
+    errors: Tuple[str, ...] = ()
+    warnings: Tuple[str, ...] = ()
     score: int = 0
 
     def __bool__(self) -> bool:
         return self.valid
 
 
-def validate(faf: Union[FafFile, Dict[str, Any], str]) -> ValidationResult:
+# Shared results for the common clean outcomes (safe to share: frozen)
+_VALID_QUICK = ValidationResult(valid=True)
+_VALID_COMPLETE = ValidationResult(valid=True, score=100)
+
+
+def validate(faf: Union["FafFile", "FafData", Dict[str, Any], str],
+             mode: str = "full",
+             node: Optional[Any] = None) -> ValidationResult:
     """
     Validate FAF file structure and completeness
 
     Args:
-        faf: FafFile, raw dict, or YAML string to validate
+        faf: FafFile, FafData, raw dict, or YAML string to validate
+        mode: "full" (default) or "quick". Quick mode runs only the checks
+            that decide validity - no warnings, and score is left at 0.
+        node: Composed YAML node tree for `faf`, used to add line numbers
+            to messages. FafFiles carry their own line numbers.
 
     Returns:
-        ValidationResult with errors, warnings, and score
+        ValidationResult with errors, warnings, and score. A document
+        missing faf_version or project gets only those errors.
 
     Example:
         >>> result = validate(faf)
@@ -46,154 +97,205 @@ def validate(faf: Union[FafFile, Dict[str, Any], str]) -> ValidationResult:
         ...     print("Errors:", result.errors)
         >>> print(f"Score: {result.score}%")
     """
-    errors: List[str] = []
-    warnings: List[str] = []
+    if mode not in ("full", "quick"):
+        raise ValueError(f"mode must be 'full' or 'quick', got {mode!r}")
+    quick = mode == "quick"
 
     # Parse if string
     if isinstance(faf, str):
+        if node is None:
+            return _validate_str(faf, mode)
+        from .parser import parse
         try:
             faf = parse(faf)
         except Exception as e:
             return ValidationResult(
                 valid=False,
-                errors=[f"Parse error: {e}"],
+                errors=(f"Parse error: {e}",),
                 score=0
             )
 
-    # Get raw data
-    if isinstance(faf, FafFile):
-        data = faf.raw
-    else:
+    # Line numbers - from the given node tree, else those kept by the FafFile
+    lines: Optional[Dict[str, int]] = None
+    if node is not None:
+        from .parser import _key_lines
+        lines = _key_lines(node)
+
+    # Get raw data - FafFile (and FafData) carry it in .raw
+    if isinstance(faf, dict):
         data = faf
+    else:
+        data = faf.raw
+        if lines is None:
+            lines = getattr(faf, "_lines", None)
 
-    # Required fields
-    if "faf_version" not in data:
-        errors.append("Missing required field: faf_version")
+    return _validate_into(data, lines, quick, [], [])
 
-    if "project" not in data:
-        errors.append("Missing required field: project")
-    else:
-        project = data["project"]
-        if isinstance(project, dict):
-            if "name" not in project:
-                errors.append("Missing required field: project.name")
-        elif not isinstance(project, str):
-            errors.append("project must be object or string")
-
-    # Recommended sections
-    if "instant_context" not in data:
-        warnings.append("Missing recommended section: instant_context")
-    else:
-        ic = data["instant_context"]
-        if isinstance(ic, dict):
-            if "what_building" not in ic:
-                warnings.append("Missing instant_context.what_building")
-            if "tech_stack" not in ic:
-                warnings.append("Missing instant_context.tech_stack")
 
-    if "stack" not in data:
-        warnings.append("Missing recommended section: stack")
+def validate_many(fafs: Iterable[Union["FafFile", "FafData", Dict[str, Any], str]],
+                  mode: str = "full") -> List[ValidationResult]:
+    """
+    Validate a batch of FAF files
+
+    Same checks and results as calling validate() on each item, with the
+    per-call setup done once for the whole batch.
 
-    # Optional but useful
-    if "human_context" not in data:
-        warnings.append("Missing section: human_context (the 6 W's)")
+    Args:
+        fafs: FafFiles, FafData, raw dicts, or YAML strings to validate
+        mode: "full" (default) or "quick", as for validate()
+
+    Returns:
+        List of ValidationResult, in input order
+
+    Example:
+        >>> results = validate_many(parse_file(p) for p in paths)
+        >>> invalid = [p for p, r in zip(paths, results) if not r.valid]
+    """
+    if mode not in ("full", "quick"):
+        raise ValueError(f"mode must be 'full' or 'quick', got {mode!r}")
+    quick = mode == "quick"
 
-    if "ai_instructions" not in data:
-        warnings.append("Missing section: ai_instructions")
+    errors: List[str] = []
+    warnings: List[str] = []
+    results: List[ValidationResult] = []
+    append = results.append
+    for faf in fafs:
+        if isinstance(faf, str):
+            append(_validate_str(faf, mode))
+            continue
+        if isinstance(faf, dict):
+            append(_validate_into(faf, None, quick, errors, warnings))
+        else:
+            append(_validate_into(faf.raw, getattr(faf, "_lines", None),
+                                  quick, errors, warnings))
+        errors.clear()
+        warnings.clear()
+    return results
+
+
+def _validate_into(data: Dict[str, Any], lines: Optional[Dict[str, int]], quick: bool,
+                   errors: List[str], warnings: List[str]) -> ValidationResult:
+    """Check a raw FAF dict, collecting messages into the given lists"""
+    # Without faf_version or project the document is invalid whatever else
+    # it holds, so report just those and skip the remaining checks
+    if "faf_version" not in data or "project" not in data:
+        return ValidationResult(valid=False, errors=tuple(
+            message for key, _, severity, message, _ in _RULES
+            if severity == "required" and key not in data
+        ))
+
+    # Sections, scored and checked in one pass (generated from _RULES)
+    score = _check_sections(data, lines, quick, errors, warnings)
 
     # Type validations
+    if "project" in data and not isinstance(data["project"], (dict, str)):
+        errors.append(_at("project must be object or string", lines, "project"))
+
     if "tags" in data and not isinstance(data["tags"], list):
-        errors.append("tags must be an array")
+        errors.append(_at("tags must be an array", lines, "tags"))
 
     if "ai_score" in data:
         score_val = data["ai_score"]
         if isinstance(score_val, str):
-            if not score_val.endswith("%"):
-                warnings.append("ai_score should end with % (e.g., '85%')")
+            if not score_val.endswith("%") and not quick:
+                warnings.append(_at("ai_score should end with % (e.g., '85%')", lines, "ai_score"))
         elif not isinstance(score_val, (int, float)):
-            errors.append("ai_score must be number or percentage string")
-
-    # Calculate completeness score
-    score = _calculate_score(data)
-
-    return ValidationResult(
-        valid=len(errors) == 0,
-        errors=errors,
-        warnings=warnings,
-        score=score
-    )
-
+            errors.append(_at("ai_score must be number or percentage string", lines, "ai_score"))
 
-def _calculate_score(data: Dict[str, Any]) -> int:
-    """
-    Calculate completeness score based on filled sections
+    if quick:
+        if not errors:
+            return _VALID_QUICK
+        return ValidationResult(valid=False, errors=tuple(errors))
 
-    Scoring breakdown:
-    - Required fields (30 points)
-    - Core sections (40 points)
-    - Extended sections (30 points)
-    """
-    score = 0
-    max_score = 100
-
-    # Required fields (30 points)
-    if "faf_version" in data:
-        score += 10
-    if "project" in data:
-        score += 10
-        project = data["project"]
-        if isinstance(project, dict):
-            if project.get("name"):
-                score += 5
-            if project.get("goal"):
-                score += 5
-
-    # Core sections (40 points)
-    if "instant_context" in data:
-        ic = data["instant_context"]
+    # Score rules that don't fit the table: a detailed stack, and non-empty tags
+    stack = data.get("stack")
+    if isinstance(stack, dict) and len(stack) > 2:
         score += 5
-        if isinstance(ic, dict):
-            if ic.get("what_building"):
-                score += 5
-            if ic.get("tech_stack"):
-                score += 5
-            if ic.get("key_files"):
-                score += 5
-
-    if "stack" in data:
-        score += 10
-        stack = data["stack"]
-        if isinstance(stack, dict) and len(stack) > 2:
-            score += 5
-
-    if "context_quality" in data:
+    if data.get("tags"):
         score += 5
 
-    # Extended sections (30 points)
-    if "human_context" in data:
-        score += 10
+    if score >= 100 and not errors and not warnings:
+        return _VALID_COMPLETE
 
-    if "ai_instructions" in data:
-        score += 5
+    return ValidationResult(
+        valid=len(errors) == 0,
+        errors=tuple(errors),
+        warnings=tuple(warnings),
+        score=score if score < 100 else 100
+    )
 
-    if "preferences" in data:
-        score += 5
 
-    if "state" in data:
-        score += 5
+@functools.lru_cache(maxsize=512)
+def _validate_str(content: str, mode: str) -> ValidationResult:
+    """Parse and validate a YAML string; memoized on the content"""
+    from .parser import parse
+    try:
+        faf = parse(content)
+    except Exception as e:
+        return ValidationResult(
+            valid=False,
+            errors=(f"Parse error: {e}",),
+            score=0
+        )
+    return validate(faf, mode)
 
-    if data.get("tags"):
-        score += 5
 
-    return min(score, max_score)
+def _at(message: str, lines: Optional[Dict[str, int]], key: str) -> str:
+    """Suffix message with the source line of a top-level key, when known"""
+    line = lines.get(key) if lines else None
+    return message if line is None else f"{message} (line {line})"
 
 
-def validate_quick(content: str) -> Tuple[bool, str]:
+def _build_check_sections() -> Callable[..., int]:
+    """
+    Generate the _RULES walk as straight-line code
+
+    The generated function appends each missing-section message to errors
+    or warnings according to its severity and returns the section score,
+    with every key, point value and message inlined as a constant.
+    """
+    lines = ["def check_sections(data, lines, quick, errors, warnings):",
+             "    score = 0"]
+    for key, points, severity, message, subs in _RULES:
+        lines += [f"    if {key!r} in data:",
+                  f"        score += {points}"]
+        if subs:
+            lines += [f"        s = data[{key!r}]",
+                      "        if isinstance(s, dict):"]
+            for sub_key, sub_points, sub_message in subs:
+                lines.append(f"            if s.get({sub_key!r}):")
+                lines.append(f"                score += {sub_points}")
+                if sub_message:
+                    target = "errors" if severity == "required" else "warnings"
+                    cond = f"{sub_key!r} not in s"
+                    if severity != "required":
+                        cond = f"not quick and {cond}"
+                    lines += [f"            elif {cond}:",
+                              f"                {target}.append(_at({sub_message!r}, lines, {key!r}))"]
+        if severity == "required":
+            lines += ["    else:",
+                      f"        errors.append({message!r})"]
+        elif severity == "recommended":
+            lines += ["    elif not quick:",
+                      f"        warnings.append({message!r})"]
+    lines.append("    return score")
+
+    ns: Dict[str, Any] = {"_at": _at}
+    exec(compile("\n".join(lines) + "\n", "<faf_sdk.validator.check_sections>", "exec"), ns)
+    return ns["check_sections"]  # type: ignore[no-any-return]
+
+
+_check_sections = _build_check_sections()
+
+
+def validate_quick(content: Union["FafFile", "FafData", Dict[str, Any], str]
+                   ) -> Tuple[bool, str]:
     """
     Quick validation returning simple pass/fail with message
 
     Args:
-        content: YAML string to validate
+        content: YAML string to validate, or an already parsed FafFile,
+            FafData or raw dict (no second parse)
 
     Returns:
         Tuple of (valid, message)
@@ -21,13 +21,13 @@ import tempfile
 import threading
 import traceback
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from faf_sdk import parse, validate, find_faf_file, stringify
-from faf_sdk.parser import FafParseError
+from faf_sdk.parser import FafParseError, clear_cache
 from faf_sdk.discovery import should_ignore, list_project_files
 
 
@@ -390,11 +390,14 @@ stack:
   database: SQLite
 """
         iterations = 1000
-        start = time.time()
+        # parse() caches by content - clear it so every iteration really parses
+        _parse, _clear = parse, clear_cache
+        start = time.perf_counter_ns()
         for _ in range(iterations):
-            parse(content)
-        elapsed = time.time() - start
-        per_parse = (elapsed / iterations) * 1000  # ms
+            _clear()
+            _parse(content)
+        elapsed_ms = (time.perf_counter_ns() - start) / 1_000_000
+        per_parse = elapsed_ms / iterations
         assert per_parse < 5, f"Parse too slow: {per_parse:.2f}ms"
         print(f"    → {per_parse:.2f}ms per parse ({iterations} iterations)")
 
@@ -414,11 +417,12 @@ stack:
 """
         faf = parse(content)
         iterations = 1000
-        start = time.time()
+        _validate = validate
+        start = time.perf_counter_ns()
         for _ in range(iterations):
-            validate(faf)
-        elapsed = time.time() - start
-        per_validate = (elapsed / iterations) * 1000  # ms
+            _validate(faf)
+        elapsed_ms = (time.perf_counter_ns() - start) / 1_000_000
+        per_validate = elapsed_ms / iterations
         assert per_validate < 1, f"Validate too slow: {per_validate:.2f}ms"
         print(f"    → {per_validate:.2f}ms per validate ({iterations} iterations)")
 
@@ -431,11 +435,12 @@ tags: [a, b, c, d, e]
 """
         faf = parse(content)
         iterations = 1000
-        start = time.time()
+        _stringify = stringify
+        start = time.perf_counter_ns()
         for _ in range(iterations):
-            stringify(faf)
-        elapsed = time.time() - start
-        per_op = (elapsed / iterations) * 1000
+            _stringify(faf)
+        elapsed_ms = (time.perf_counter_ns() - start) / 1_000_000
+        per_op = elapsed_ms / iterations
         assert per_op < 1, f"Stringify too slow: {per_op:.2f}ms"
         print(f"    → {per_op:.2f}ms per stringify ({iterations} iterations)")
 
@@ -463,9 +468,7 @@ project:
                 errors.append(f"Thread {i}: {e}")
 
         with ThreadPoolExecutor(max_workers=20) as executor:
-            futures = [executor.submit(parse_task, i) for i in range(100)]
-            for f in as_completed(futures):
-                f.result()
+            list(executor.map(parse_task, range(100)))
 
         assert len(errors) == 0, f"Errors: {errors}"
 
@@ -489,9 +492,7 @@ project:
                     errors.append(f"Task {i}: {e}")
 
             with ThreadPoolExecutor(max_workers=10) as executor:
-                futures = [executor.submit(find_task, i) for i in range(10)]
-                for f in as_completed(futures):
-                    f.result()
+                list(executor.map(find_task, range(10)))
 
             assert len(errors) == 0, f"Errors: {errors}"
 
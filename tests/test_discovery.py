@@ -2,11 +2,15 @@
 
 import os
 import tempfile
+import time
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from faf_sdk import find_faf_file, find_project_root, load_fafignore
-from faf_sdk.discovery import should_ignore, list_project_files, DEFAULT_IGNORE_PATTERNS
+from faf_sdk import discovery, find_faf_file, find_project_root, load_fafignore
+from faf_sdk.discovery import (
+    should_ignore, list_project_files, invalidate_cache, DEFAULT_IGNORE_PATTERNS
+)
 
 
 class TestFindFafFile:
@@ -56,6 +60,48 @@ class TestFindFafFile:
         result = find_faf_file(str(tmp_path))
         assert result is None
 
+    def test_invalidate_cache(self, tmp_path):
+        """Cached misses are dropped by invalidate_cache"""
+        assert find_faf_file(str(tmp_path)) is None
+
+        faf_file = tmp_path / "project.faf"
+        faf_file.write_text("faf_version: 2.5.0\nproject:\n  name: test")
+        invalidate_cache()
+
+        result = find_faf_file(str(tmp_path))
+        assert result == os.path.realpath(str(faf_file))
+
+    def test_concurrent_lookups_share_one_walk(self, tmp_path, monkeypatch):
+        """Threads asking for the same directory wait for a single walk"""
+        calls = []
+        real_walk = discovery._find_faf_file
+
+        def slow_walk(start_dir, max_depth):
+            calls.append(start_dir)
+            time.sleep(0.05)
+            return real_walk(start_dir, max_depth)
+
+        monkeypatch.setattr(discovery, "_find_faf_file", slow_walk)
+        (tmp_path / "project.faf").write_text("faf_version: 2.5.0")
+        invalidate_cache()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: find_faf_file(str(tmp_path)), range(8)))
+
+        assert len(calls) == 1
+        assert len(set(results)) == 1 and results[0] is not None
+
+    def test_waiter_skips_expired_entry(self, monkeypatch):
+        """A waiter whose owner failed recomputes instead of reusing stale data"""
+        key = ("test_waiter_skips_expired_entry",)
+        monkeypatch.setitem(discovery._discovery_cache, key,
+                            (time.monotonic() - discovery._CACHE_TTL - 1, "stale"))
+        finished = discovery.threading.Event()
+        finished.set()  # the owning walk already ended without storing a result
+        monkeypatch.setitem(discovery._inflight, key, finished)
+
+        assert discovery._cached(key, lambda: "fresh") == "fresh"
+
 
 class TestFindProjectRoot:
     """Test find_project_root function"""
@@ -84,6 +130,16 @@ class TestFindProjectRoot:
         result = find_project_root(str(tmp_path))
         assert result == os.path.realpath(str(tmp_path))
 
+    def test_dangling_marker_symlink_ignored(self, tmp_path):
+        """A broken package.json symlink doesn't mark a root"""
+        (tmp_path / "package.json").write_text("{}")
+        inner = tmp_path / "inner"
+        inner.mkdir()
+        (inner / "package.json").symlink_to(tmp_path / "missing.json")
+
+        result = find_project_root(str(inner))
+        assert result == os.path.realpath(str(tmp_path))
+
 
 class TestShouldIgnore:
     """Test should_ignore function"""
@@ -108,6 +164,12 @@ class TestShouldIgnore:
         assert should_ignore("project/.DS_Store", patterns)
         assert not should_ignore("config.env", patterns)
 
+    def test_nested_directory_pattern(self):
+        """Nested directory patterns only match from the root"""
+        patterns = ["src/gen/"]
+        assert should_ignore("src/gen/out.py", patterns)
+        assert not should_ignore("lib/src/gen/out.py", patterns)
+
     def test_default_patterns(self):
         """Test default ignore patterns"""
         patterns = DEFAULT_IGNORE_PATTERNS
@@ -130,6 +192,16 @@ class TestLoadFafignore:
         assert "*.secret" in patterns
         assert "# comment" not in patterns
 
+    def test_reload_after_edit(self, tmp_path):
+        """Editing .fafignore is picked up without invalidation"""
+        fafignore = tmp_path / ".fafignore"
+        fafignore.write_text("first/\n")
+        assert load_fafignore(str(tmp_path)) == ["first/"]
+
+        fafignore.write_text("second/\n")
+        os.utime(fafignore, (0, 12345))
+        assert load_fafignore(str(tmp_path)) == ["second/"]
+
     def test_default_when_missing(self, tmp_path):
         """Use defaults when no .fafignore"""
         patterns = load_fafignore(str(tmp_path))
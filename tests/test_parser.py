@@ -1,8 +1,11 @@
 """Tests for FAF parser"""
 
+import os
+
 import pytest
-from faf_sdk import parse, stringify
-from faf_sdk.parser import FafParseError
+import yaml
+from faf_sdk import parse, parse_bytes, parse_file, parse_many, parser, stringify
+from faf_sdk.parser import FafParseError, clear_cache, get_field
 
 
 class TestParse:
@@ -72,6 +75,12 @@ project:
         with pytest.raises(FafParseError, match="YAML"):
             parse(content)
 
+    def test_parse_invalid_yaml_names_path(self):
+        """Syntax errors mention the path given to parse()"""
+        content = "faf_version: 2.5.0\nproject:\n  name: [unclosed-path"
+        with pytest.raises(FafParseError, match="in x.faf"):
+            parse(content, path="x.faf")
+
     def test_parse_non_object(self):
         """Reject non-object YAML"""
         with pytest.raises(FafParseError, match="object"):
@@ -102,6 +111,72 @@ project:
         faf = parse(content)
         assert faf.data.raw.get("ai_score") == 80
 
+    def test_parse_matches_yaml_load(self):
+        """Scalars, anchors and merge keys load as yaml.safe_load does"""
+        content = """
+faf_version: 2.5.0
+project:
+  name: test
+flags: [yes, off, ~, 010, 0x1F, 1_000, -5, 42, 1.5, 2024-01-01, "7"]
+base: &base {lang: python}
+copy: *base
+merged:
+  <<: *base
+  extra: true
+"""
+        faf = parse(content)
+        assert faf.raw == yaml.safe_load(content)
+        assert faf.raw["copy"] is faf.raw["base"]
+
+
+class TestParseBytes:
+    """Test parse_bytes function"""
+
+    def test_parse_bytes_basic(self):
+        """Parse UTF-8 bytes without decoding first"""
+        faf = parse_bytes("faf_version: 2.5.0\nproject:\n  name: bytes-ü".encode("utf-8"))
+        assert faf.project_name == "bytes-ü"
+
+    def test_parse_bytes_buffer_types(self):
+        """Accept bytearray and memoryview"""
+        buf = b"faf_version: 2.5.0\nproject:\n  name: buf"
+        assert parse_bytes(bytearray(buf)).project_name == "buf"
+        assert parse_bytes(memoryview(buf)).project_name == "buf"
+
+    def test_parse_bytes_utf16(self):
+        """UTF-16 with a BOM is passed to the YAML reader intact"""
+        doc = "faf_version: 2.5.0\nproject:\n  name: wide-ü\n"
+        for encoding in ("utf-16-be", "utf-16-le"):
+            faf = parse_bytes(("\ufeff" + doc).encode(encoding))
+            assert faf.project_name == "wide-ü"
+
+    def test_parse_bytes_rejects_str(self):
+        """Reject non-bytes input"""
+        with pytest.raises(FafParseError, match="bytes"):
+            parse_bytes("faf_version: 2.5.0")
+
+    def test_parse_bytes_empty(self):
+        """Reject empty buffers"""
+        with pytest.raises(FafParseError, match="empty"):
+            parse_bytes(b"  \n ")
+
+
+class TestParseMany:
+    """Test parse_many function"""
+
+    def test_parse_many_mixed(self):
+        """Strings and bytes parse in input order"""
+        fafs = parse_many([
+            "faf_version: 2.5.0\nproject:\n  name: one",
+            b"faf_version: 2.5.0\nproject:\n  name: two",
+        ])
+        assert [f.project_name for f in fafs] == ["one", "two"]
+
+    def test_parse_many_invalid(self):
+        """An invalid document raises"""
+        with pytest.raises(FafParseError):
+            parse_many(["faf_version: 2.5.0\nproject:\n  name: ok", "- not a dict"])
+
 
 class TestStringify:
     """Test stringify function"""
@@ -143,3 +218,93 @@ project:
         assert faf.project_name == "prop-test"
         assert faf.score == 90
         assert faf.version == "2.5.0"
+
+
+class TestParseCache:
+    """Test parse/parse_file result caching"""
+
+    def test_same_content_parsed_once(self, monkeypatch):
+        """Identical content is parsed once"""
+        calls = []
+        compose = parser._compose_and_construct
+        monkeypatch.setattr(parser, "_compose_and_construct",
+                            lambda content: calls.append(content) or compose(content))
+        content = "faf_version: 2.5.0\nproject:\n  name: cached-once"
+        first = parse(content)
+        second = parse(content, path="other.faf")
+        assert len(calls) == 1
+        assert first.data == second.data
+        assert second.path == "other.faf"
+        assert first.path is None
+
+    def test_cached_results_are_independent(self):
+        """Editing one result doesn't leak into later parses"""
+        content = "faf_version: 2.5.0\nproject:\n  name: mine\ntags:\n  - a"
+        first = parse(content)
+        first.raw["project"]["name"] = "edited"
+        first.data.tags.append("b")
+
+        second = parse(content)
+        assert second.raw["project"]["name"] == "mine"
+        assert second.project_name == "mine"
+        assert second.data.tags == ["a"]
+
+    def test_parse_file_results_are_independent(self, tmp_path):
+        """Editing a parse_file() result doesn't leak into the next call"""
+        faf_file = tmp_path / "project.faf"
+        faf_file.write_text("faf_version: 2.5.0\nproject:\n  name: on-disk")
+        first = parse_file(str(faf_file))
+        first.raw["project"]["name"] = "edited"
+        assert parse_file(str(faf_file)).raw["project"]["name"] == "on-disk"
+
+    def test_parse_file_relative_path_per_cwd(self, tmp_path, monkeypatch):
+        """The same relative path in two directories isn't one cache entry"""
+        for name in ("one", "two"):
+            (tmp_path / name).mkdir()
+            faf_file = tmp_path / name / "project.faf"
+            faf_file.write_text(f"faf_version: 2.5.0\nproject:\n  name: {name}")
+            os.utime(faf_file, ns=(0, 0))
+
+        monkeypatch.chdir(tmp_path / "one")
+        assert parse_file("project.faf").project_name == "one"
+        monkeypatch.chdir(tmp_path / "two")
+        assert parse_file("project.faf").project_name == "two"
+
+    def test_parse_file_invalidates_on_change(self, tmp_path):
+        """Editing the file busts the cache"""
+        faf_file = tmp_path / "project.faf"
+        faf_file.write_text("faf_version: 2.5.0\nproject:\n  name: before")
+        assert parse_file(str(faf_file)).project_name == "before"
+
+        faf_file.write_text("faf_version: 2.5.0\nproject:\n  name: after-edit")
+        assert parse_file(str(faf_file)).project_name == "after-edit"
+
+    def test_clear_cache(self, monkeypatch):
+        """clear_cache drops memoized results"""
+        content = "faf_version: 2.5.0\nproject:\n  name: cleared"
+        parse(content)
+        clear_cache()
+        calls = []
+        compose = parser._compose_and_construct
+        monkeypatch.setattr(parser, "_compose_and_construct",
+                            lambda content: calls.append(content) or compose(content))
+        parse(content)
+        assert len(calls) == 1
+
+
+class TestGetField:
+    """Test get_field lookups"""
+
+    def test_lookup_respects_default(self):
+        """A missing field returns each call's default"""
+        faf = parse("faf_version: 2.5.0\nproject:\n  name: fields")
+        assert get_field(faf, "project", "name") == "fields"
+        assert get_field(faf, "stack", "backend", default="a") == "a"
+        assert get_field(faf, "stack", "backend", default="b") == "b"
+
+    def test_lookup_sees_raw_edits(self):
+        """Lookups read the current raw dict"""
+        faf = parse("faf_version: 2.5.0\nproject:\n  name: before-edit")
+        assert get_field(faf, "project", "name") == "before-edit"
+        faf.raw["project"]["name"] = "after-edit"
+        assert get_field(faf, "project", "name") == "after-edit"
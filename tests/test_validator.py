@@ -1,7 +1,11 @@
 """Tests for FAF validator"""
 
+import dataclasses
+import subprocess
+import sys
+
 import pytest
-from faf_sdk import parse, validate
+from faf_sdk import parse, validate, validate_many
 from faf_sdk.validator import validate_quick
 
 
@@ -39,6 +43,17 @@ faf_version: 2.5.0
         assert not result.valid
         assert any("project" in e for e in result.errors)
 
+    def test_validate_missing_required_stops_early(self):
+        """Missing faf_version/project skips the remaining checks"""
+        result = validate({"tags": "nope", "stack": {}})
+        assert not result.valid
+        assert result.errors == (
+            "Missing required field: faf_version",
+            "Missing required field: project",
+        )
+        assert result.warnings == ()
+        assert result.score == 0
+
     def test_validate_missing_name(self):
         """Error on missing project.name"""
         content = """
@@ -131,6 +146,22 @@ tags:
         full_result = validate(full)
         assert full_result.score > min_result.score
 
+    def test_validate_line_numbers(self):
+        """Errors on parsed input carry source line numbers"""
+        content = """faf_version: 2.5.0
+project:
+  goal: no name here
+tags: not-a-list
+"""
+        result = validate(content)
+        assert "Missing required field: project.name (line 2)" in result.errors
+        assert "tags must be an array (line 4)" in result.errors
+
+    def test_validate_fafdata(self):
+        """FafData is validated through its raw dict"""
+        faf = parse("faf_version: 2.5.0\nproject:\n  name: typed\n")
+        assert validate(faf.data) == validate(faf.raw)
+
 
 class TestValidateQuick:
     """Test validate_quick function"""
@@ -155,3 +186,104 @@ project:
         valid, msg = validate_quick(content)
         assert not valid
         assert "invalid" in msg.lower()
+
+    def test_quick_parsed(self):
+        """Parsed input gives the same answer as the YAML string"""
+        content = "faf_version: 2.5.0\nproject:\n  name: test\n"
+        faf = parse(content)
+        assert validate_quick(faf) == validate_quick(content)
+        assert validate_quick(faf.raw) == validate_quick(content)
+
+
+class TestValidateQuickMode:
+    """Test validate(mode="quick")"""
+
+    def test_quick_mode_skips_warnings_and_score(self):
+        """Quick mode only reports validity"""
+        content = """
+faf_version: 2.5.0
+project:
+  name: test
+"""
+        result = validate(content, mode="quick")
+        assert result.valid
+        assert result.warnings == ()
+        assert result.score == 0
+
+    def test_quick_mode_same_validity(self):
+        """Quick mode reports the same errors as full mode"""
+        data = {"project": {"goal": "x"}, "tags": "nope"}
+        assert validate(data, mode="quick").errors == validate(data).errors
+
+    def test_unknown_mode(self):
+        """Reject unknown modes"""
+        with pytest.raises(ValueError):
+            validate({}, mode="fast")
+
+
+class TestValidateCache:
+    """Test memoized validation of YAML strings"""
+
+    def test_repeat_string_returns_cached_result(self):
+        """Same content returns the same frozen result"""
+        content = "faf_version: 2.5.0\nproject:\n  name: cached\n"
+        first = validate(content)
+        assert validate(content) is first
+        assert validate(content, mode="quick") is not first
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            first.valid = False  # type: ignore[misc]
+
+    def test_result_is_hashable(self):
+        """Results with equal contents hash equal"""
+        data = {"faf_version": "2.5.0", "project": {"name": "x"}}
+        assert hash(validate(data)) == hash(validate(dict(data)))
+        assert isinstance(validate(data).errors, tuple)
+
+    def test_clean_results_are_shared(self):
+        """Clean quick results reuse one instance"""
+        data = {"faf_version": "2.5.0", "project": {"name": "x"}}
+        assert validate(data, mode="quick") is validate(dict(data), mode="quick")
+
+
+class TestValidateMany:
+    """Test validate_many function"""
+
+    def test_matches_validate(self):
+        """Batch results match one-by-one validation, in order"""
+        items = [
+            "faf_version: 2.5.0\nproject:\n  name: a\n",
+            {"project": {"name": "b"}},
+            parse("faf_version: 2.5.0\nproject:\n  goal: c\ntags: x\n"),
+            {"faf_version": "2.5.0", "project": {"name": "d"}, "ai_score": "85"},
+        ]
+        for mode in ("full", "quick"):
+            assert validate_many(items, mode=mode) == [validate(i, mode=mode) for i in items]
+
+    def test_unknown_mode(self):
+        """Reject unknown modes"""
+        with pytest.raises(ValueError):
+            validate_many([], mode="fast")
+
+
+class TestLazyImport:
+    """Test that validating dicts doesn't load the YAML stack"""
+
+    def test_validate_dict_skips_yaml(self):
+        """from faf_sdk import validate loads neither the parser nor PyYAML"""
+        code = (
+            "import sys\n"
+            "from faf_sdk import validate\n"
+            "validate({'faf_version': '2.5.0', 'project': {'name': 'x'}})\n"
+            "assert 'yaml' not in sys.modules and 'faf_sdk.parser' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_submodule_attribute_access(self):
+        """Submodules stay reachable as faf_sdk.<name>, loaded on first use"""
+        code = (
+            "import faf_sdk\n"
+            "assert isinstance(faf_sdk.parser.USING_LIBYAML, bool)\n"
+            "for name in ('validator', 'discovery', 'types', 'mk4'):\n"
+            "    assert getattr(faf_sdk, name).__name__ == 'faf_sdk.' + name\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)